@@ -20,11 +20,74 @@ import re
 from typing import Any
 
 
+def _count(patterns: list[re.Pattern[str]], text: str, cap: int = 0) -> int:
+    """Count the patterns that match `text`, stopping once `cap` have matched (0 counts all)."""
+    found = 0
+    for pattern in patterns:
+        if pattern.search(text):
+            found += 1
+            if found == cap:
+                break
+    return found
+
+
+# Patterns are compiled once at import time. Case-insensitive patterns are
+# written in lowercase and searched in a lowercased copy of the output, which
+# keeps them plain literal searches that re can skip through quickly.
+#
+# Each pattern is searched separately. With the stdlib re engine this is
+# several times faster than fusing them into one alternation: search() stops
+# at the first hit and can use each pattern's literal prefix, while a fused
+# pattern has to try every alternative at every position.
+SECTION_PATTERNS = [
+    (re.compile(r"overview|summary|introduction"), "overview"),
+    (re.compile(r"step[\s-]?by[\s-]?step|step \d|first,|then,|finally,|1\."), "steps"),
+    (re.compile(r"key concept|important|note|remember"), "key points"),
+]
+
+EDUCATIONAL_PATTERNS = [
+    re.compile(p)
+    for p in (
+        r"this (?:code|function|method|query|snippet)",
+        r"returns|produces|creates|generates|outputs",
+        r"means|indicates|represents|is used to",
+        r"because|since|therefore|so that",
+        r"for example|such as|like|e\.g\.",
+    )
+]
+
+ERROR_PATTERNS = [
+    re.compile(p)
+    for p in (
+        r"i don'?t know",
+        r"i cannot (?:explain|understand|help)",
+        r"error occurred",
+        r"unable to (?:process|analyze|explain)",
+        r"not sure what",
+        r"invalid (?:code|syntax|input)",
+    )
+]
+
+# Per language: names, matched case-insensitively, and code keywords, matched
+# case-sensitively against the original output.
+LANGUAGE_PATTERNS = {
+    language: ([re.compile(p) for p in names], [re.compile(p) for p in keywords])
+    for language, (names, keywords) in {
+        "python": ([r"\bpython\b"], [r"\bdef\b", r"\bimport\b", r"__\w+__"]),
+        "javascript": ([r"\bjavascript\b", r"\bjs\b"], [r"\bfunction\b", r"\bconst\b", r"\blet\b"]),
+        "sql": ([r"\bsql\b", r"\bquery\b", r"\bselect\b", r"\btable\b"], []),
+        "java": ([r"\bjava\b"], [r"\bclass\b", r"\bpublic\b", r"\bprivate\b"]),
+        "typescript": ([r"\btypescript\b", r"\bts\b"], [r"\binterface\b", r"\btype\b"]),
+    }.items()
+}
+
+
 def grade(context: dict[str, Any]) -> dict[str, Any]:
     """Grade a code explanation.
     
     Evaluates explanations on 5 criteria (20 points each):
-    1. Sufficient length - meaningful explanation, not too brief
+    1. Sufficient length - meaningful explanation, not too brief.
+       Outputs below the minimum fail outright and skip the other checks.
     2. Structured sections - overview, steps, key concepts
     3. Language identification - mentions the programming language
     4. Educational tone - explanatory language, not just code
@@ -46,6 +109,7 @@ def grade(context: dict[str, Any]) -> dict[str, Any]:
     """
     output = context.get("output", "")
     task = context.get("task", {})
+    language = task.get("inputs", {}).get("context", {}).get("language", "")
     
     score = 0.0
     checks = []
@@ -53,86 +117,72 @@ def grade(context: dict[str, Any]) -> dict[str, Any]:
     # Check 1: Minimum length (20 points)
     # A good explanation should be at least 200 characters
     min_length = 200
-    if len(output) >= min_length:
-        score += 0.2
-        checks.append(f"✓ Sufficient length ({len(output)} chars >= {min_length})")
-    else:
+    if len(output) < min_length:
+        # Short outputs are almost always timeouts, empty responses or error
+        # messages, so don't spend any regex scans on them.
         checks.append(f"✗ Too short ({len(output)} chars < {min_length})")
-    
-    # Check 2: Has structured sections (20 points)
-    # Look for organizational patterns in the explanation
-    section_patterns = [
-        (r"(?i)(overview|summary|introduction)", "overview"),
-        (r"(?i)(step[\s-]?by[\s-]?step|step \d|first,|then,|finally,|1\.)", "steps"),
-        (r"(?i)(key concept|important|note|remember)", "key points"),
-    ]
-    sections_found = []
-    for pattern, name in section_patterns:
-        if re.search(pattern, output):
-            sections_found.append(name)
-    
-    if len(sections_found) >= 2:
-        score += 0.2
-        checks.append(f"✓ Has structured sections: {', '.join(sections_found)}")
+        checks.extend(
+            f"✗ {name} skipped due to short output"
+            for name in ("Structure check", "Language check", "Educational tone check", "Error indicator check")
+        )
     else:
-        checks.append(f"✗ Missing structure (found: {sections_found or 'none'})")
-    
-    # Check 3: Identifies programming language (20 points)
-    language = task.get("inputs", {}).get("context", {}).get("language", "")
-    language_indicators = {
-        "python": [r"(?i)\bpython\b", r"\bdef\b", r"\bimport\b", r"__\w+__"],
-        "javascript": [r"(?i)\bjavascript\b", r"(?i)\bjs\b", r"\bfunction\b", r"\bconst\b", r"\blet\b"],
-        "sql": [r"(?i)\bsql\b", r"(?i)\bquery\b", r"(?i)\bselect\b", r"(?i)\btable\b"],
-        "java": [r"(?i)\bjava\b", r"\bclass\b", r"\bpublic\b", r"\bprivate\b"],
-        "typescript": [r"(?i)\btypescript\b", r"(?i)\bts\b", r"\binterface\b", r"\btype\b"],
-    }
-    
-    if language and language in language_indicators:
-        patterns = language_indicators[language]
-        matches = [p for p in patterns if re.search(p, output)]
-        if matches:
+        score += 0.2
+        checks.append(f"✓ Sufficient length ({len(output)} chars >= {min_length})")
+        
+        # Case-fold once; `output` keeps its original case for the code keyword
+        # checks and the reported length. Unlike (?i) matching, str.lower() can
+        # turn some non-ASCII letters into more than an ASCII letter (e.g. "İ"
+        # becomes "i" plus a combining dot), so such text no longer matches the
+        # lowercase patterns.
+        text = output.lower()
+        
+        # Check 2: Has structured sections (20 points)
+        # Look for organizational patterns in the explanation
+        sections_found = []
+        for pattern, name in SECTION_PATTERNS:
+            if pattern.search(text):
+                sections_found.append(name)
+                if len(sections_found) == 2:
+                    break
+        
+        if len(sections_found) >= 2:
             score += 0.2
-            checks.append(f"✓ Identifies {language} ({len(matches)} indicators)")
+            checks.append(f"✓ Has structured sections: {', '.join(sections_found)}")
         else:
-            checks.append(f"✗ Does not clearly identify {language}")
-    else:
-        # No language specified or unknown language - give benefit of doubt
-        score += 0.2
-        checks.append("✓ Language check skipped (not specified)")
-    
-    # Check 4: Educational tone (20 points)
-    # Look for explanatory language patterns
-    educational_patterns = [
-        r"(?i)this (code|function|method|query|snippet)",
-        r"(?i)(returns|produces|creates|generates|outputs)",
-        r"(?i)(means|indicates|represents|is used to)",
-        r"(?i)(because|since|therefore|so that)",
-        r"(?i)(for example|such as|like|e\.g\.)",
-    ]
-    edu_matches = [p for p in educational_patterns if re.search(p, output)]
-    
-    if len(edu_matches) >= 2:
-        score += 0.2
-        checks.append(f"✓ Educational tone ({len(edu_matches)} patterns)")
-    else:
-        checks.append(f"✗ Could be more educational ({len(edu_matches)} patterns)")
-    
-    # Check 5: No error indicators (20 points)
-    error_patterns = [
-        r"(?i)i don'?t know",
-        r"(?i)i cannot (explain|understand|help)",
-        r"(?i)error occurred",
-        r"(?i)unable to (process|analyze|explain)",
-        r"(?i)not sure what",
-        r"(?i)invalid (code|syntax|input)",
-    ]
-    errors_found = [p for p in error_patterns if re.search(p, output)]
-    
-    if not errors_found:
-        score += 0.2
-        checks.append("✓ No error indicators")
-    else:
-        checks.append(f"✗ Contains error indicators ({len(errors_found)} found)")
+            checks.append(f"✗ Missing structure (found: {sections_found or 'none'})")
+        
+        # Check 3: Identifies programming language (20 points)
+        if language and language in LANGUAGE_PATTERNS:
+            names, keywords = LANGUAGE_PATTERNS[language]
+            matches = _count(names, text) + _count(keywords, output)
+            if matches:
+                score += 0.2
+                checks.append(f"✓ Identifies {language} ({matches} indicators)")
+            else:
+                checks.append(f"✗ Does not clearly identify {language}")
+        else:
+            # No language specified or unknown language - give benefit of doubt
+            score += 0.2
+            checks.append("✓ Language check skipped (not specified)")
+        
+        # Check 4: Educational tone (20 points)
+        # Look for explanatory language patterns
+        edu_matches = _count(EDUCATIONAL_PATTERNS, text, cap=2)
+        
+        if edu_matches >= 2:
+            score += 0.2
+            checks.append(f"✓ Educational tone ({edu_matches}+ patterns)")
+        else:
+            checks.append(f"✗ Could be more educational ({edu_matches} patterns)")
+        
+        # Check 5: No error indicators (20 points)
+        errors_found = _count(ERROR_PATTERNS, text)
+        
+        if not errors_found:
+            score += 0.2
+            checks.append("✓ No error indicators")
+        else:
+            checks.append(f"✗ Contains error indicators ({errors_found} found)")
     
     # Determine pass/fail (60% threshold)
     passed = score >= 0.6
@@ -396,11 +396,7 @@ func (e *CopilotEngine) setupWorkspace(resources []ResourceFile) (string, error)
 }
 
 func joinStrings(parts []string) string {
-	var builder strings.Builder
-	for _, p := range parts {
-		builder.WriteString(p)
-	}
-	return builder.String()
+	return strings.Join(parts, "")
 }
 
 func allowAllTools(request copilot.PermissionRequest, invocation copilot.PermissionInvocation) (copilot.PermissionRequestResult, error) {
@@ -2,11 +2,26 @@ import json
 import sys
 import re
 
+# orjson parses the (potentially large) transcript payloads much faster, but it's optional - we
+# run on whatever Python the user has installed.
+# NOTE: the two encoders format differently - orjson writes compact JSON, json.dumps puts a space
+# after separators. Neither adds a trailing newline. The caller's json.Unmarshal accepts both.
+try:
+    import orjson
+
+    loads = orjson.loads
+    dumps = orjson.dumps
+except ImportError:
+    loads = json.loads
+
+    def dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 ## NOTE: if you're editing this file do NOT print to stdout - we parse that in the caller to determine
 ## what's failed.
 
-input_data = sys.stdin.read()
-data = json.loads(input_data)
+input_data = sys.stdin.buffer.read()
+data = loads(input_data)
 
 # stderr isn't captured by the caller, so you can use this to do some print debugging.
 # print(f"Received data: {input_data}", file=sys.stderr)
@@ -15,18 +30,19 @@ def print_stderr(*args, **kwargs):
     print(*args, **kwargs, file=sys.stderr)
 
 if data.get('debug'):
-    print_stderr(input_data)
+    print_stderr(input_data.decode())
 
 eval_context = {
     "output": data['output'] or "",
     "outcome": data['outcome'],
     "transcript": data['transcript'],
     "tool_calls": data['tool_calls'],
-    "errors": [t for t in data['transcript'] if "error" in t.get("type") or "error" in str(t.get("content", ""))],
     "duration_ms": data['duration_ms'],
     "len": len,
     "any": any,
     "all": all,
+    # this is the stdlib module on purpose - assertions are written against its syntax (lookarounds,
+    # backreferences), which drop-in engines like RE2 don't support.
     "re": re,
     "str": str,
     "int": int,
@@ -38,6 +54,11 @@ eval_context = {
     "False": False,
 }
 
+# building 'errors' stringifies every transcript event, which is expensive for long sessions, so
+# only do it when an assertion can actually reference it.
+if any("errors" in assertion for assertion in data['assertions']):
+    eval_context["errors"] = [t for t in data['transcript'] if "error" in t.get("type") or "error" in str(t.get("content", ""))]
+
 # anything but empty string means we failed.
 # 'fail' if it's just an assertion failure
 # any other string is assumed to be an exception of some kind (ie, bad syntax, using a non-existent field).
@@ -50,6 +71,6 @@ for assertion in data['assertions']:
     except Exception as e:
         results.append(str(e))
 
-print(json.dumps({
+sys.stdout.buffer.write(dumps({
     "results": results,
 }))
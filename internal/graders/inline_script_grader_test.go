@@ -9,6 +9,7 @@ import (
 	"os"
 	"os/exec"
 	"path/filepath"
+	"strings"
 	"testing"
 
 	copilot "github.com/github/copilot-sdk/go"
@@ -247,11 +248,20 @@ func TestWithError(t *testing.T) {
 		Type: copilot.AssistantMessage,
 	})
 
+	collector.On(copilot.SessionEvent{
+		Data: copilot.Data{
+			Content: utils.Ptr("all good"),
+		},
+		ID:   "7d3c1f8a-0b6e-4c2f-9a51-2f0e8f1c6b3d",
+		Type: copilot.AssistantMessage,
+	})
+
 	transcript := convertToTranscriptEvents(collector.SessionEvents())
 
 	grader, err := NewInlineScriptGrader("test", models.InlineScriptGraderParameters{Language: models.LanguagePython, Assertions: []string{
-		"len(transcript) == 1",
+		"len(transcript) == 2",
 		"len(errors) == 1", // ie, we expect some errors.
+		"errors[0]['content'] == 'oh no there was a fake error'",
 		"len(tool_calls) == 0",
 	}})
 	require.NoError(t, err)
@@ -260,9 +270,30 @@ func TestWithError(t *testing.T) {
 		Transcript: transcript,
 	})
 	require.NoError(t, err)
+	require.Equal(t, allAssertionsPassedMsg, results.Feedback)
 	require.True(t, results.Passed)
 }
 
+func TestErrorsBuiltOnlyWhenReferenced(t *testing.T) {
+	skipIfNoPython(t)
+
+	// Assertions can't observe 'errors' without naming it, so this uses a transcript event with no
+	// 'type' as a probe: building the list raises on it, which fails the script. The Go side always
+	// sends a 'type', so the payload goes straight to the script.
+	const inputFmt = `{"output": "", "outcome": {}, "transcript": [{"content": "no type here"}], "tool_calls": [], "duration_ms": 0, "assertions": [%q]}`
+
+	t.Run("skipped_when_not_referenced", func(t *testing.T) {
+		output, err := runEvalWrapperPy(t, fmt.Sprintf(inputFmt, "len(transcript) == 1"))
+		require.NoError(t, err)
+		require.JSONEq(t, `{"results": [""]}`, string(output))
+	})
+
+	t.Run("built_when_referenced", func(t *testing.T) {
+		_, err := runEvalWrapperPy(t, fmt.Sprintf(inputFmt, "len(errors) == 0"))
+		require.Error(t, err)
+	})
+}
+
 func TestWithSyntaxError(t *testing.T) {
 	t.Run("python", func(t *testing.T) {
 		skipIfNoPython(t)
@@ -299,6 +330,16 @@ func TestUnsupportedLanguage(t *testing.T) {
 	require.Contains(t, err.Error(), "language 'ruby' is not yet supported")
 }
 
+func runEvalWrapperPy(t *testing.T, stdin string) ([]byte, error) {
+	scriptPath := filepath.Join(t.TempDir(), "eval_wrapper.py")
+	require.NoError(t, os.WriteFile(scriptPath, []byte(evalWrapperPy), 0644))
+
+	cmd := exec.Command(resolvePythonBin(), scriptPath)
+	cmd.Stdin = strings.NewReader(stdin)
+
+	return cmd.Output()
+}
+
 func loadSampleEvents(t *testing.T) []copilot.SessionEvent {
 	reader, err := os.Open(filepath.Join("..", "testdata", "copilot_events_using_skill.json"))
 	require.NoError(t, err)